@@ -4,13 +4,18 @@ Inspired by Dave Ebbelaar's single file AI agents
 Uses Claude API with tool calling
 """
 
-import json
+import asyncio
+import contextlib
 import os
-from datetime import datetime
-from typing import Any
-
-import requests
-from anthropic import Anthropic
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, NotRequired, TypedDict
+
+import httpx
+import orjson
+from anthropic import AsyncAnthropic
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from rich.console import Console
@@ -22,17 +27,54 @@ load_dotenv()
 
 # Initialize clients
 console = Console()
-client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
 # Configuration
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 WEATHER_API_URL = "https://api.openweathermap.org/data/2.5"
 MODEL_NAME = "claude-sonnet-4-20250514"
 MAX_ITERATIONS = 10
+DEBUG = os.getenv("AGENT_DEBUG") == "1"
+
+# Endpoint URLs and shared query params, built once at import
+_CURRENT_URL = f"{WEATHER_API_URL}/weather"
+_FORECAST_URL = f"{WEATHER_API_URL}/forecast"
+_BASE_PARAMS = {"appid": WEATHER_API_KEY}
+
+# Retry transient weather API failures instead of failing the whole turn
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_MAX = 5.0
+RETRY_DEADLINE = 15.0  # Total seconds one request may spend across all attempts
+
+# Shared async HTTP client so concurrent tool calls reuse pooled connections.
+# The transport retries failed connects, _get_with_retry handles status codes.
+http_client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=RETRY_ATTEMPTS,
+    ),
+    timeout=10,
+    headers={"Accept-Encoding": "gzip, deflate"},
+)
+
+# Cache successful tool results, current conditions change faster than forecasts
+_CURRENT_CACHE: TTLCache = TTLCache(maxsize=256, ttl=600)
+_FORECAST_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+# Speculative current weather fetches started from the user's message
+PREFETCH_PATTERN = re.compile(
+    r"(?i:weather|forecast)\b.*?\bin ([A-Z]\w*(?:,? [A-Z]\w*)*)"
+)
+IMPERIAL_PATTERN = re.compile(r"\b(?:fahrenheit|imperial)\b|°f\b", re.IGNORECASE)
+_PREFETCH_TASKS: dict[tuple[str, str], asyncio.Task] = {}
 
 # ============================================================================
 # Pydantic Models for Structured Data
 # ============================================================================
+# Tools build these shapes as plain dicts; the models document them and can
+# validate a payload at the API boundary when needed.
 
 
 class WeatherData(BaseModel):
@@ -75,12 +117,12 @@ class ForecastData(BaseModel):
     forecasts: list[ForecastItem] = Field(description="List of forecast items")
 
 
-class ToolResult(BaseModel):
-    """Result from tool execution"""
+class ToolResult(TypedDict):
+    """Result from tool execution, a plain dict to keep the agent loop cheap"""
 
-    success: bool = Field(description="Whether tool execution succeeded")
-    data: Any | None = Field(default=None, description="Tool output data")
-    error: str | None = Field(default=None, description="Error message if failed")
+    success: bool  # Whether tool execution succeeded
+    data: NotRequired[Any]  # Tool output data
+    error: NotRequired[str]  # Error message if failed
 
 
 # ============================================================================
@@ -88,64 +130,139 @@ class ToolResult(BaseModel):
 # ============================================================================
 
 
-def get_current_weather(location: str, units: str = "metric") -> ToolResult:
-    """
-    Fetch current weather data for a location using OpenWeatherMap API.
+def _retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a capped Retry-After header"""
+    backoff = RETRY_BACKOFF * 2**attempt
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after is None:
+        return backoff
 
-    Args:
-        location (str): City name.
-        units (str): Units for temperature ('metric' or 'imperial').
+    if retry_after.strip().isdigit():
+        delay = float(retry_after)
+    else:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return backoff
 
-    Returns:
-        ToolResult: Result containing weather data or error message.
-    """
+    return min(max(delay, 0.0), RETRY_AFTER_MAX)
+
+
+async def _get_with_retry(url: str, params: dict) -> httpx.Response:
+    """GET from the weather API, retrying timeouts and retryable status codes"""
     try:
-        location = location.strip()
+        async with asyncio.timeout(RETRY_DEADLINE):
+            for attempt in range(RETRY_ATTEMPTS):
+                try:
+                    response = await http_client.get(url, params=params)
+                except (httpx.ReadTimeout, httpx.WriteTimeout):
+                    # Connect failures are already retried by the transport
+                    await asyncio.sleep(_retry_delay(None, attempt))
+                    continue
 
-        console.print(f"[cyan] Fetching current weather for {location}...[/cyan]")
-        url = f"{WEATHER_API_URL}/weather"
-        params = {"q": location, "appid": WEATHER_API_KEY, "units": units}
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                await asyncio.sleep(_retry_delay(response, attempt))
+
+            return await http_client.get(url, params=params)
+    except TimeoutError:
+        raise httpx.TimeoutException(
+            f"No response from the weather API within {RETRY_DEADLINE:g}s"
+        ) from None
 
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
 
-        data = response.json()
-
-        weather_data = WeatherData(
-            location=data["name"],
-            country=data["sys"]["country"],
-            temperature=data["main"]["temp"],
-            feels_like=data["main"]["feels_like"],
-            temp_min=data["main"]["temp_min"],
-            temp_max=data["main"]["temp_max"],
-            humidity=data["main"]["humidity"],
-            pressure=data["main"]["pressure"],
-            description=data["weather"][0]["description"],
-            main=data["weather"][0]["main"],
-            wind_speed=data["wind"]["speed"],
-            clouds=data["clouds"]["all"],
-            visibility=data.get("visibility", 0),
-            sunrise=datetime.fromtimestamp(data["sys"]["sunrise"]).strftime("%H:%M"),
-            sunset=datetime.fromtimestamp(data["sys"]["sunset"]).strftime("%H:%M"),
-            units=units,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+async def warm_up_connection() -> None:
+    """Open a pooled connection to the weather API ahead of the first tool call"""
+    # Best effort, a failed warm up just means the first tool call connects itself
+    with contextlib.suppress(httpx.HTTPError):
+        await http_client.head(WEATHER_API_URL)
+
+
+def _hhmm(ts: float) -> str:
+    """Format a unix timestamp as local HH:MM"""
+    lt = time.localtime(ts)
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}"
+
+
+def _now_timestamp() -> str:
+    """Format the current local time as YYYY-MM-DD HH:MM:SS"""
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+
+async def _fetch_current_weather(location: str, units: str) -> ToolResult:
+    """Fetch and cache current weather without console output"""
+    try:
+        location = location.strip()
+
+        response = await _get_with_retry(
+            _CURRENT_URL, {**_BASE_PARAMS, "q": location, "units": units}
         )
+        response.raise_for_status()
 
+        data = orjson.loads(response.content)
+
+        # Build the WeatherData shape directly, the API response is trusted
+        weather_data = {
+            "location": data["name"],
+            "country": data["sys"]["country"],
+            "temperature": data["main"]["temp"],
+            "feels_like": data["main"]["feels_like"],
+            "temp_min": data["main"]["temp_min"],
+            "temp_max": data["main"]["temp_max"],
+            "humidity": data["main"]["humidity"],
+            "pressure": data["main"]["pressure"],
+            "description": data["weather"][0]["description"],
+            "main": data["weather"][0]["main"],
+            "wind_speed": data["wind"]["speed"],
+            "clouds": data["clouds"]["all"],
+            "visibility": data.get("visibility", 0),
+            "sunrise": _hhmm(data["sys"]["sunrise"]),
+            "sunset": _hhmm(data["sys"]["sunset"]),
+            "units": units,
+            "timestamp": _now_timestamp(),
+        }
+
+        result: ToolResult = {"success": True, "data": weather_data}
+        _CURRENT_CACHE[(location.lower(), units)] = result
+        return result
+
+    except httpx.HTTPError as e:
+        return {"success": False, "error": f"Failed to fetch weather data: {str(e)}"}
+    except Exception as e:
+        return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+
+def _print_weather_result(result: ToolResult) -> None:
+    """Report the outcome of a current weather fetch"""
+    if result["success"]:
         console.print("[green] Weather data retrieved successfully[/green]")
+    else:
+        console.print(f"[red] {result['error']}[/red]")
 
-        return ToolResult(success=True, data=weather_data.model_dump())
 
-    except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to fetch weather data: {str(e)}"
-        console.print(f"[red] {error_msg}[/red]")
-        return ToolResult(success=False, error=error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        console.print(f"[red] {error_msg}[/red]")
-        return ToolResult(success=False, error=error_msg)
+async def get_current_weather(location: str, units: str = "metric") -> ToolResult:
+    """
+    Fetch current weather data for a location using OpenWeatherMap API.
+
+    Args:
+        location (str): City name.
+        units (str): Units for temperature ('metric' or 'imperial').
+
+    Returns:
+        ToolResult: Result containing weather data or error message.
+    """
+    key = (location.strip().lower(), units)
+    if key in _CURRENT_CACHE:
+        console.print(f"[dim] Using cached weather for {location.strip()}[/dim]")
+        return _CURRENT_CACHE[key]
+
+    console.print(f"[cyan] Fetching current weather for {location.strip()}...[/cyan]")
+    result = await _fetch_current_weather(location, units)
+    _print_weather_result(result)
+    return result
 
 
-def get_weather_forecast(location: str, units: str = "metric") -> ToolResult:
+async def get_weather_forecast(location: str, units: str = "metric") -> ToolResult:
     """
     Fetch 5-day weather forecast a location using OpenWeatherMap API.
 
@@ -156,48 +273,72 @@ def get_weather_forecast(location: str, units: str = "metric") -> ToolResult:
     Returns:
         ToolResult: Result containing weather data or error message.
     """
+    key = (location.strip().lower(), units)
+    if key in _FORECAST_CACHE:
+        console.print(f"[dim] Using cached forecast for {location.strip()}[/dim]")
+        return _FORECAST_CACHE[key]
+
     try:
         location = location.strip()
 
         console.print(f"[cyan] Fetching forecast for {location}...[/cyan]")
-        url = f"{WEATHER_API_URL}/forecast"
-        params = {"q": location, "appid": WEATHER_API_KEY, "units": units}
-
-        response = requests.get(url, params=params, timeout=10)
+        response = await _get_with_retry(
+            _FORECAST_URL, {**_BASE_PARAMS, "q": location, "units": units}
+        )
         response.raise_for_status()
 
-        data = response.json()
-
-        forecasts = []
-        for item in data["list"][:40]:
-            forecasts.append(
-                ForecastItem(
-                    datetime=item["dt_txt"],
-                    temperature=item["main"]["temp"],
-                    description=item["weather"][0]["description"],
-                    wind_speed=item["wind"]["speed"],
-                    humidity=item["main"]["humidity"],
-                )
-            )
-
-        forecast_data = ForecastData(
-            location=data["city"]["name"],
-            country=data["city"]["country"],
-            forecasts=forecasts,
-        )
+        data = orjson.loads(response.content)
+
+        # Build the ForecastData shape directly, the API response is trusted
+        forecast_data = {
+            "location": data["city"]["name"],
+            "country": data["city"]["country"],
+            "forecasts": [
+                {
+                    "datetime": item["dt_txt"],
+                    "temperature": item["main"]["temp"],
+                    "description": item["weather"][0]["description"],
+                    "wind_speed": item["wind"]["speed"],
+                    "humidity": item["main"]["humidity"],
+                }
+                for item in data["list"][:40]
+            ],
+        }
 
         console.print("[green] Forecast data retrieved successfully[/green]")
 
-        return ToolResult(success=True, data=forecast_data.model_dump())
+        result: ToolResult = {"success": True, "data": forecast_data}
+        _FORECAST_CACHE[key] = result
+        return result
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_msg = f"Failed to fetch weather data: {str(e)}"
         console.print(f"[red] {error_msg}[/red]")
-        return ToolResult(success=False, error=error_msg)
+        return {"success": False, "error": error_msg}
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         console.print(f"[red] {error_msg}[/red]")
-        return ToolResult(success=False, error=error_msg)
+        return {"success": False, "error": error_msg}
+
+
+async def get_weather(kind: str, location: str, units: str = "metric") -> ToolResult:
+    """
+    Fetch current weather or the 5-day forecast for a location.
+
+    Args:
+        kind (str): 'current' for present conditions or 'forecast' for 5 days.
+        location (str): City name.
+        units (str): Units for temperature ('metric' or 'imperial').
+
+    Returns:
+        ToolResult: Result containing weather data or error message.
+    """
+    if kind == "current":
+        return await get_current_weather(location, units)
+    if kind == "forecast":
+        return await get_weather_forecast(location, units)
+
+    return {"success": False, "error": f"Unknown weather kind: {kind}"}
 
 
 # ============================================================================
@@ -206,37 +347,27 @@ def get_weather_forecast(location: str, units: str = "metric") -> ToolResult:
 
 TOOLS = [
     {
-        "name": "get_current_weather",
+        "name": "get_weather",
         "description": (
-            "Fetches current weather data for a specified location. "
-            "Use this when the user asks about current weather conditions, "
+            "Fetches weather data for a specified location. "
+            'Use kind "current" when the user asks about current weather conditions, '
             "temperature, humidity, wind, or any present-moment weather information. "
-            "Supports precise locations using 'city,state,country' "
-            "format for small towns."
+            'Use kind "forecast" (next 5 days in 3-hour intervals) when the user asks '
+            "about future weather, forecasts, upcoming conditions, or what the "
+            "weather will be like. Supports precise locations using "
+            "'city,state,country' format for small towns."
         ),
         "input_schema": {
             "type": "object",
             "properties": {
-                "location": {
+                "kind": {
                     "type": "string",
-                    "description": 'Location in one of these formats: "City", "City,Country", or "City,State,Country". Examples: "London", "Paris,FR", "Austin,TX,US", "Bladenboro,NC,US". For small towns, use the full "City,State,Country" format for best results. Use ISO 3166 country codes (US, GB, FR, etc.) and standard 2-letter state codes (TX, CA, NC, etc.)',
+                    "enum": ["current", "forecast"],
+                    "description": (
+                        'Which data to fetch: "current" for present conditions, '
+                        '"forecast" for the 5-day forecast.'
+                    ),
                 },
-                "units": {
-                    "type": "string",
-                    "enum": ["metric", "imperial"],
-                    "description": 'Temperature units: "metric" for Celsius, "imperial" for Fahrenheit. Default is metric.',
-                    "default": "metric",
-                },
-            },
-            "required": ["location"],
-        },
-    },
-    {
-        "name": "get_weather_forecast",
-        "description": "Fetches weather forecast data (next 5 days in 3-hour intervals) for a specified location. Use this when the user asks about future weather, forecasts, upcoming conditions, or what the weather will be like. Supports precise locations using 'city,state,country' format for small towns.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
                 "location": {
                     "type": "string",
                     "description": 'Location in one of these formats: "City", "City,Country", or "City,State,Country". Examples: "London", "Paris,FR", "Austin,TX,US", "Bladenboro,NC,US". For small towns, use the full "City,State,Country" format for best results. Use ISO 3166 country codes (US, GB, FR, etc.) and standard 2-letter state codes (TX, CA, NC, etc.)',
@@ -248,14 +379,17 @@ TOOLS = [
                     "default": "metric",
                 },
             },
-            "required": ["location"],
+            "required": ["kind", "location"],
         },
     },
 ]
 
+# Prompt caching breakpoint on the last tool caches the whole tools prefix
+CACHE_CONTROL = {"type": "ephemeral"}
+CACHED_TOOLS = [*TOOLS[:-1], {**TOOLS[-1], "cache_control": CACHE_CONTROL}]
+
 TOOL_MAP = {
-    "get_current_weather": get_current_weather,
-    "get_weather_forecast": get_weather_forecast,
+    "get_weather": get_weather,
 }
 
 # ============================================================================
@@ -263,19 +397,62 @@ TOOL_MAP = {
 # ============================================================================
 
 
-def process_tool_call(tool_name: str, tool_input: dict) -> ToolResult:
+def prefetch_weather(user_message: str) -> asyncio.Task | None:
+    """Start fetching current weather for a location named in the user's message"""
+    match = PREFETCH_PATTERN.search(user_message)
+    if not match:
+        return None
+
+    location = match.group(1)
+    units = "imperial" if IMPERIAL_PATTERN.search(user_message) else "metric"
+    key = (location.strip().lower(), units)
+    if key in _CURRENT_CACHE or key in _PREFETCH_TASKS:
+        return None
+
+    # The fetch populates the cache itself, so only in-flight tasks are tracked.
+    # It stays quiet so nothing is printed into Claude's streamed text.
+    task = asyncio.create_task(_fetch_current_weather(location, units))
+    _PREFETCH_TASKS[key] = task
+    task.add_done_callback(lambda _: _PREFETCH_TASKS.pop(key, None))
+    return task
+
+
+async def process_tool_call(tool_name: str, tool_input: dict) -> ToolResult:
     """Execute a tool and return the result"""
     if tool_name not in TOOL_MAP:
-        return ToolResult(success=False, error=f"Unknown tool: {tool_name}")
+        return {"success": False, "error": f"Unknown tool: {tool_name}"}
+
+    # Reuse a matching speculative fetch that is still in flight
+    location = tool_input.get("location")
+    if (
+        tool_name == "get_weather"
+        and tool_input.get("kind") == "current"
+        and isinstance(location, str)
+    ):
+        key = (location.strip().lower(), tool_input.get("units", "metric"))
+        if key in _PREFETCH_TASKS:
+            location = location.strip()
+            console.print(f"[dim] Using prefetched weather for {location}[/dim]")
+            result = await _PREFETCH_TASKS[key]
+            _print_weather_result(result)
+            return result
 
     tool_func = TOOL_MAP[tool_name]
-    return tool_func(**tool_input)
+    try:
+        return await tool_func(**tool_input)
+    except Exception as e:
+        # Report the failure to Claude rather than cancelling sibling tool calls
+        error_msg = f"Tool {tool_name} failed: {str(e)}"
+        console.print(f"[red] {error_msg}[/red]")
+        return {"success": False, "error": error_msg}
 
 
-def run_agent(user_message: str) -> str:
+async def run_agent(user_message: str) -> str:
     """
     Run the agentic loop: send message to claude, process tool calls, return response.
 
+    Claude's text is streamed to the console as it arrives.
+
     Args:
         user_message: Users input query
 
@@ -284,65 +461,125 @@ def run_agent(user_message: str) -> str:
     """
     messages = [{"role": "user", "content": user_message}]
 
+    # Overlap a likely weather lookup with Claude's first turn. Without one,
+    # still open the weather API connection while Claude is thinking.
+    background = prefetch_weather(user_message) or asyncio.create_task(
+        warm_up_connection()
+    )
+
+    try:
+        return await _agent_loop(messages)
+    finally:
+        # Unfinished background work must not resume during the next turn
+        background.cancel()
+        await asyncio.wait([background])
+
+
+async def _agent_loop(messages: list) -> str:
+    """Call Claude and run requested tools until it produces a final answer"""
+    # Most recent tool results carrying the moving conversation cache breakpoint
+    cached_results: dict | None = None
+
     for iteration in range(MAX_ITERATIONS):
         console.print(f"\n[dim]--- Iteration {iteration + 1} ---[/dim]")
 
-        # Call Claude API
-        response = client.messages.create(
-            model=MODEL_NAME, max_tokens=4096, tools=TOOLS, messages=messages
-        )
+        # Call Claude API, streaming text to the console as it is generated.
+        # Iterations that only request tools produce no text deltas.
+        async with client.messages.stream(
+            model=MODEL_NAME, max_tokens=4096, tools=CACHED_TOOLS, messages=messages
+        ) as stream:
+            streamed_text = False
+            async for text in stream.text_stream:
+                # Deltas are fragments of a sentence: let the terminal wrap them
+                # and don't let Rich restyle partial tokens
+                console.print(
+                    text,
+                    end="",
+                    style="white",
+                    markup=False,
+                    emoji=False,
+                    highlight=False,
+                    soft_wrap=True,
+                )
+                streamed_text = True
+
+            response = await stream.get_final_message()
 
-        # TODO This is for Debugging, Can remove later
-        console.print(f"[dim]Stop reason: {response.stop_reason}[/dim]")
+        if streamed_text:
+            console.print()
+
+        if DEBUG:
+            console.print(f"[dim]Stop reason: {response.stop_reason}[/dim]")
 
         # Check is Claude needs a tool
         if response.stop_reason == "tool_use":
             assistant_message = {"role": "assistant", "content": response.content}
             messages.append(assistant_message)
 
-            tool_results = []
-
-            for block in response.content:
-                if block.type == "tool_use":
-                    tool_name = block.name
-                    tool_input = block.input
+            tool_blocks = [
+                block for block in response.content if block.type == "tool_use"
+            ]
 
+            if DEBUG:
+                for block in tool_blocks:
+                    tool_input = orjson.dumps(block.input, option=orjson.OPT_INDENT_2)
                     console.print(
-                        f"[yellow] Calling tool: {tool_name}({json.dumps(tool_input, indent=2)})[/yellow]"
+                        f"[yellow] Calling tool: {block.name}"
+                        f"({tool_input.decode()})[/yellow]"
                     )
 
-                    result = process_tool_call(tool_name, tool_input)
-
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": json.dumps(
-                                {
-                                    "success": result.success,
-                                    "data": result.data,
-                                    "error": result.error,
-                                }
-                            ),
-                        }
-                    )
+            # Run every requested tool concurrently, results keep block order
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(process_tool_call(block.name, block.input))
+                    for block in tool_blocks
+                ]
+
+            tool_results = []
+
+            for block, task in zip(tool_blocks, tasks, strict=True):
+                result = task.result()
+
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": orjson.dumps(
+                            {
+                                "success": result["success"],
+                                "data": result.get("data"),
+                                "error": result.get("error"),
+                            }
+                        ).decode(),
+                    }
+                )
+
+            # Move the cache breakpoint to the end of the conversation so the
+            # next iteration reuses everything before it (max 4 breakpoints)
+            if cached_results is not None:
+                del cached_results["cache_control"]
+            cached_results = tool_results[-1]
+            cached_results["cache_control"] = CACHE_CONTROL
 
             messages.append({"role": "user", "content": tool_results})
 
             # Continue the loop to get Claudes next response
         elif response.stop_reason == "end_turn":
             # Claude finished the loop and provided a response
-            final_response = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    final_response += block.text
-
-            return final_response
+            return "".join(
+                block.text for block in response.content if hasattr(block, "text")
+            )
 
         else:
-            return f"Unexpected stop reason: {response.stop_reason}"
+            error_msg = f"Unexpected stop reason: {response.stop_reason}"
+            console.print(f"[white]{error_msg}[/white]")
+            return error_msg
 
-    return "Maximum iterations reached. Please try again with a more specific query"
+    error_msg = (
+        "Maximum iterations reached. Please try again with a more specific query"
+    )
+    console.print(f"[white]{error_msg}[/white]")
+    return error_msg
 
 
 # ============================================================================
@@ -350,9 +587,8 @@ def run_agent(user_message: str) -> str:
 # ============================================================================
 
 
-def print_welcome():
-    """Display welcome message"""
-    welcome_text = """
+# Built once at import so the welcome panel is ready before main() runs
+WELCOME_TEXT = """
     # AI Weather Agent
 
     Hello!  I am an intelligent weather assistant powered by Claude.
@@ -374,7 +610,12 @@ def print_welcome():
 
     *Powered by Claude and OpenWeatherMap*
     """
-    console.print(Panel(Markdown(welcome_text), border_style="blue"))
+_WELCOME_PANEL = Panel(Markdown(WELCOME_TEXT), border_style="blue")
+
+
+def print_welcome():
+    """Display welcome message"""
+    console.print(_WELCOME_PANEL)
 
 
 def main():
@@ -382,6 +623,9 @@ def main():
 
     print_welcome()
 
+    # One event loop for the whole session so pooled connections are reused
+    runner = asyncio.Runner()
+
     while True:
         try:
             console.print("\n[bold cyan]You:[/bold cyan]", end=" ")
@@ -398,8 +642,8 @@ def main():
                 continue
 
             console.print("\n[bold yellow]Assistant:[/bold yellow]")
-            response = run_agent(user_input)
-            console.print(f"[white]{response}[/white]")
+            # The response is streamed to the console by the agent loop
+            runner.run(run_agent(user_input))
 
         except KeyboardInterrupt:
             console.print("\n\n[bold red] Interrupted. Goodbye[/bold red]\n")
@@ -409,6 +653,9 @@ def main():
             console.print(f"\n[bold red] Error: {e}[/bold red]")
             continue
 
+    runner.run(http_client.aclose())
+    runner.close()
+
 
 if __name__ == "__main__":
     main()